@@ -8,6 +8,7 @@ Exposes:
 - VoltageDividerConstraints
 - InverseDividerConstraints
 - solve
+- solve_batch
 - voltage_divider
 - voltage_divider_from_constraints
 - forward_divider
@@ -16,7 +17,7 @@ Exposes:
 
 from .constraints import VoltageDividerConstraints
 from .inverse import InverseDividerConstraints
-from .solver import solve
+from .solver import solve, solve_batch
 from .circuit import (
     voltage_divider,
     voltage_divider_from_constraints,
@@ -28,6 +29,7 @@ __all__ = [
     "VoltageDividerConstraints",
     "InverseDividerConstraints",
     "solve",
+    "solve_batch",
     "voltage_divider",
     "voltage_divider_from_constraints",
     "forward_divider",
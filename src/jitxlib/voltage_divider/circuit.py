@@ -7,12 +7,28 @@ from jitx.inspect import decompose
 from jitx.net import Net, Port
 from jitx.toleranced import Toleranced
 from jitxlib.parts.convert import convert_component
+from jitxlib.parts._types.resistor import Resistor
 
 from .solver import VoltageDividerSolution, solve
 from .constraints import VoltageDividerConstraints
 from .inverse import InverseDividerConstraints
 
 
+# Cache of the component classes generated by convert_component, keyed on the
+# part's MPN and the instance name. Building many dividers re-uses the same
+# resistor parts, and the class codegen is the expensive part of conversion.
+_component_class_cache: dict[tuple[str, str], type] = {}
+
+
+def _convert_resistor(resistor: Resistor, component_name: str) -> type:
+    key = (resistor.mpn, component_name)
+    cls = _component_class_cache.get(key)
+    if cls is None:
+        cls = convert_component(resistor.component, component_name=component_name)
+        _component_class_cache[key] = cls
+    return cls
+
+
 class VoltageDividerCircuit(Circuit):
     """
     Circuit for a voltage divider solution.
@@ -35,8 +51,8 @@ class VoltageDividerCircuit(Circuit):
         self.out = Port()
         self.lo = Port()
         # Resistor instances
-        self.r_hi = convert_component(sol.R_h.component, component_name="r_hi")()
-        self.r_lo = convert_component(sol.R_l.component, component_name="r_lo")()
+        self.r_hi = _convert_resistor(sol.R_h, "r_hi")()
+        self.r_lo = _convert_resistor(sol.R_l, "r_lo")()
         # Nets (connections)
         h_p1, h_p2 = decompose(self.r_hi, Port)
         l_p1, l_p2 = decompose(self.r_lo, Port)
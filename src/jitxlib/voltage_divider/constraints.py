@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple, Union
+from typing import Optional, Tuple, Union
 
 from jitx.toleranced import Toleranced
 from jitxlib.parts import ResistorQuery
@@ -7,7 +7,7 @@ from jitxlib.parts import ResistorQuery
 from .settings import OPERATING_TEMPERATURE
 
 # Default values from utils.stanza
-STD_PRECS = [20.0, 10.0, 5.0, 2.0, 1.0, 0.5, 0.25, 0.1]  # Percentages, unitless
+STD_PRECS = (20.0, 10.0, 5.0, 2.0, 1.0, 0.5, 0.25, 0.1)  # Percentages, unitless
 DEF_MIN_SRCS = 3
 DEF_QUERY_LIMIT = 50
 DEF_SEARCH_RANGE = 10.0  # Percent, unitless
@@ -88,7 +88,7 @@ class VoltageDividerConstraints:
     v_in: Toleranced
     v_out: Toleranced
     current: float
-    prec_series: List[float] = field(default_factory=lambda: list(STD_PRECS))
+    prec_series: Tuple[float, ...] = STD_PRECS
     search_range: float = DEF_SEARCH_RANGE
     min_sources: int = DEF_MIN_SRCS
     query_limit: int = DEF_QUERY_LIMIT
@@ -97,9 +97,22 @@ class VoltageDividerConstraints:
     base_query: ResistorQuery = field(default_factory=get_default_resistor_query)
 
     def __post_init__(self):
-        # Sort precision series descending
-        self.prec_series = sorted(self.prec_series, reverse=True)
+        # Normalize the precision series to an immutable, descending tuple.
+        # The default series is already ordered, so only sort overrides that
+        # arrive out of order.
+        series = tuple(self.prec_series)
+        if any(a < b for a, b in zip(series, series[1:], strict=False)):
+            series = tuple(sorted(series, reverse=True))
+        self.prec_series = series
         ensure_sources_limits(self.min_sources, self.query_limit)
+        # Scalar bounds of the voltage constraints, precomputed once so the
+        # hot paths don't chase Toleranced attribute indirection per call.
+        self._vin_typ = self.v_in.typ
+        self._vin_min = self.v_in.min_value
+        self._vin_max = self.v_in.max_value
+        self._vout_typ = self.v_out.typ
+        self._vout_min = self.v_out.min_value
+        self._vout_max = self.v_out.max_value
 
     def compute_objective(
         self,
@@ -131,31 +144,77 @@ class VoltageDividerConstraints:
         vout = self.v_in * r_lo / (r_lo + r_hi)
         return vout
 
+    def compute_objective_corners(self, rh, rl, f):
+        """
+        Compute the (typ, min, max) corners of the objective voltage directly
+        from scalar bounds, without constructing intermediate `Toleranced` values.
+
+        The forward objective `V-in * (R-L / (R-H + R-L))` is monotonically
+        increasing in `R-L` and decreasing in `R-H`, so the worst-case corners
+        follow directly from the `1 ± f` resistance bounds.
+
+        Args:
+            rh: Nominal `hi` side resistance - either a float or a numpy array.
+            rl: Nominal `lo` side resistance - either a float or a numpy array.
+            f: Fractional precision of the resistors (e.g. 0.01 for 1%).
+        """
+        lo_factor = 1.0 - f
+        hi_factor = 1.0 + f
+        rh_lo = rh * lo_factor
+        rh_hi = rh * hi_factor
+        rl_lo = rl * lo_factor
+        rl_hi = rl * hi_factor
+        vo_typ = self._vin_typ * rl / (rh + rl)
+        vo_min = self._vin_min * rl_lo / (rl_lo + rh_hi)
+        vo_max = self._vin_max * rl_hi / (rl_hi + rh_lo)
+        return vo_typ, vo_min, vo_max
+
     def is_compliant(self, v_obj: Union[Toleranced, float]) -> bool:
         """
         Check if the computed objective voltage is within the user-defined constraints.
         """
         return self.v_out.in_range(v_obj)
 
+    def _fast_compliance(self, rh: float, rl: float, f: float) -> bool:
+        """
+        Cheap scalar compliance screen for a candidate (rh, rl) pair.
+
+        Evaluates the worst-case objective corners directly from scalar bounds
+        so that non-compliant pairs are rejected without constructing any
+        `Toleranced` values. `f` is the fractional precision (e.g. 0.01 for 1%).
+        """
+        _, vo_min, vo_max = self.compute_objective_corners(rh, rl, f)
+        return self._vout_min <= vo_min and vo_max <= self._vout_max
+
     def compute_loss(self, rh: float, rl: float, precision: float) -> Optional[float]:
         """
         Compute a loss function for a potential solution.
         Returns a positive value if compliant, or None if not a solution.
         """
-        rh_tol = Toleranced.percent(rh, precision)
-        rl_tol = Toleranced.percent(rl, precision)
-        vo = self.compute_objective(rh_tol, rl_tol)
-        if self.is_compliant(vo):
-            # This metric is suspect
-            #  - It does not consider the span of the output
-            #     For example - you could have two configurations:
-            #       1.  2.5 +/- 0.1
-            #       2.  2.499 +/- 0.01
-            #    If the target was 2.5 - then the first would have lower
-            #    loss but would not be preferred.
-            return abs(self.v_out.typ - vo.typ)
-        else:
+        # Cheap corner screen first - most candidates fail here without any
+        # Toleranced construction.
+        f = precision / 100.0
+        if not self._fast_compliance(rh, rl, f):
+            return None
+        # Confirm with the baseline Toleranced evaluation. The corners are
+        # strictly tighter than compute_objective, which widens r-lo through
+        # the interval dependency in `r-lo / (r-lo + r-hi)`, and the final
+        # gate in the solver still uses compute_objective - so a screened
+        # pair must also pass the wide evaluation to keep the two in
+        # agreement.
+        vo = self.compute_objective(
+            Toleranced.percent(rh, precision), Toleranced.percent(rl, precision)
+        )
+        if not self.is_compliant(vo):
             return None
+        # This metric is suspect
+        #  - It does not consider the span of the output
+        #     For example - you could have two configurations:
+        #       1.  2.5 +/- 0.1
+        #       2.  2.499 +/- 0.01
+        #    If the target was 2.5 - then the first would have lower
+        #    loss but would not be preferred.
+        return abs(self._vout_typ - vo.typ)
 
     def compute_initial_guess(self) -> Tuple[float, float]:
         """
@@ -98,6 +98,31 @@ class InverseDividerConstraints(VoltageDividerConstraints):
         vout = self.v_in * (1.0 + (r_hi / r_lo))
         return vout
 
+    def compute_objective_corners(self, rh, rl, f):
+        """
+        Compute the (typ, min, max) corners of the inverse objective voltage
+        directly from scalar bounds.
+
+        The inverse objective `V-in * (1 + (R-H / R-L))` is monotonically
+        increasing in `R-H` and decreasing in `R-L`, so the worst-case corners
+        follow directly from the `1 ± f` resistance bounds.
+
+        Args:
+            rh: Nominal `hi` side resistance - either a float or a numpy array.
+            rl: Nominal `lo` side resistance - either a float or a numpy array.
+            f: Fractional precision of the resistors (e.g. 0.01 for 1%).
+        """
+        lo_factor = 1.0 - f
+        hi_factor = 1.0 + f
+        rh_lo = rh * lo_factor
+        rh_hi = rh * hi_factor
+        rl_lo = rl * lo_factor
+        rl_hi = rl * hi_factor
+        vo_typ = self._vin_typ * (1.0 + rh / rl)
+        vo_min = self._vin_min * (1.0 + rh_lo / rl_hi)
+        vo_max = self._vin_max * (1.0 + rh_hi / rl_lo)
+        return vo_typ, vo_min, vo_max
+
     def compute_initial_guess(self) -> Tuple[float, float]:
         """
         Compute an initial guess for the inverse voltage divider solution.
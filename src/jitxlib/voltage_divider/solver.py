@@ -1,13 +1,23 @@
+import hashlib
+import math
+import os
+import pickle
+from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
+import numpy as np
 from jitx.toleranced import Toleranced
-from jitxlib.parts import search_resistors, ExistKeys, DistinctKey
+from jitxlib.parts import search_resistors, ExistKeys, DistinctKey, ResistorQuery
 from jitxlib.parts._types.main import to_component, PartJSON
 from jitxlib.parts._types.component import MinMax
 from jitxlib.parts._types.resistor import Resistor
 
-from .constraints import VoltageDividerConstraints
+from .constraints import (
+    STD_PRECS,
+    VoltageDividerConstraints,
+    get_default_resistor_query,
+)
 from .errors import (
     NoPrecisionSatisfiesConstraintsError,
     VinRangeTooLargeError,
@@ -16,7 +26,7 @@ from .errors import (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VoltageDividerSolution:
     """
     Voltage Divider Solution Type
@@ -27,46 +37,269 @@ class VoltageDividerSolution:
     vo: Toleranced
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Ratio:
     high: float
     low: float
     loss: float
 
 
+# Filter keys shared by all resistor queries issued by the solver.
+_EXIST_TCR_KEYS = ExistKeys(["tcr_pos", "tcr_neg"])
+_DISTINCT_RESISTANCE = DistinctKey("resistance")
+
+# Cache of raw `search_resistors` results keyed on the full query signature.
+# The same (target, precision) queries recur across the precision retries of a
+# single solve and across solves sharing a base query, and each hit saves a
+# full database round-trip. Bounded: once full, the oldest entries are evicted
+# so a long-running process sweeping many constraint sets can't grow without
+# limit.
+_QUERY_CACHE_MAX = 1024
+_query_cache: dict = {}
+
+
+# Memoized solutions keyed on the constraints' structural content (via
+# `_key_part`), which covers every field including the base query. Test suites
+# and parameter sweeps repeat identical solves; a hit skips the whole search
+# including all database traffic. Bounded like the query cache.
+_SOLVE_CACHE_MAX = 256
+_solve_cache: dict = {}
+
+
+def _cache_put(cache: dict, key, value, maxsize: int) -> None:
+    """Insert into a memo dict, evicting the oldest entries past `maxsize`."""
+    while len(cache) >= maxsize:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def clear_query_cache() -> None:
+    """Drop all memoized resistor query results (e.g. after a database update)."""
+    _query_cache.clear()
+    _solve_cache.clear()
+
+
+# Optional on-disk persistence for the query cache. When this environment
+# variable names a directory, raw query results are pickled there so repeated
+# runs (e.g. CI re-invocations) skip the database entirely. Delete the
+# directory to invalidate after a parts database update.
+QUERY_CACHE_DIR_ENV = "JITX_VD_QUERY_CACHE_DIR"
+
+
+def _key_part(value):
+    """
+    Reduce a cache-key ingredient to stable, structural primitives.
+
+    Upstream objects (ResistorQuery, ExistKeys, ...) don't guarantee
+    content-based reprs or hashability, so keys are built from their field
+    values instead. The result is hashable, order-stable, and identical
+    across processes for structurally equal inputs - which is what the
+    on-disk cache digest requires.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, Toleranced):
+        return ("Toleranced", value.min_value, value.typ, value.max_value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_key_part(v) for v in value)
+    if isinstance(value, dict):
+        return tuple((k, _key_part(v)) for k, v in sorted(value.items()))
+    state = getattr(value, "__dict__", None)
+    if state is None:
+        state = {
+            s: getattr(value, s)
+            for s in getattr(type(value), "__slots__", ())
+            if hasattr(value, s)
+        }
+    if state:
+        return (type(value).__name__, _key_part(state))
+    return (type(value).__name__, repr(value))
+
+
+def _query_key(base_query: ResistorQuery, kwargs: dict) -> tuple:
+    return (_key_part(base_query), _key_part(kwargs))
+
+
+def _persistent_cache_path(key) -> Optional[Path]:
+    cache_dir = os.environ.get(QUERY_CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    # The key is made of plain primitives, so its repr is deterministic and
+    # the digest is stable across processes.
+    digest = hashlib.blake2b(repr(key).encode()).hexdigest()[:16]
+    return Path(cache_dir) / f"rq_{digest}.pkl"
+
+
+def _cached_search_resistors(base_query: ResistorQuery, **kwargs) -> tuple:
+    key = _query_key(base_query, kwargs)
+    results = _query_cache.get(key)
+    if results is not None:
+        return results
+    path = _persistent_cache_path(key)
+    if path is not None and path.exists():
+        try:
+            results = pickle.loads(path.read_bytes())
+        except Exception:
+            # Treat an unreadable cache file as a miss and re-query.
+            results = None
+    if results is None:
+        results = tuple(search_resistors(base_query, **kwargs))
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(pickle.dumps(results))
+    _cache_put(_query_cache, key, results, _QUERY_CACHE_MAX)
+    return results
+
+
 def solve(constraints: VoltageDividerConstraints) -> VoltageDividerSolution:
     """
     Solve the Voltage Divider Constraint Problem.
+
+    Solutions are memoized on the constraints, so repeated solves with
+    identical parameters return the cached result.
+    """
+    key = _key_part(constraints)
+    sol = _solve_cache.get(key)
+    if sol is None:
+        sol = _solve(constraints)
+        _cache_put(_solve_cache, key, sol, _SOLVE_CACHE_MAX)
+    return sol
+
+
+def solve_batch(
+    constraints_list: List[VoltageDividerConstraints],
+) -> List[VoltageDividerSolution]:
+    """
+    Solve several voltage divider problems in one call.
+
+    An ordering-preserving convenience wrapper over the memoized `solve` -
+    it adds no sharing beyond what `solve` already provides, so looping over
+    `solve` directly is equivalent.
+    """
+    return [solve(cxt) for cxt in constraints_list]
+
+
+def specialize(
+    current: float,
+    base_query: Optional[ResistorQuery] = None,
+    prec_series: Tuple[float, ...] = STD_PRECS,
+    constraints_type: type = VoltageDividerConstraints,
+):
+    """
+    Partially evaluate the solver for a fixed (current, base query, series) shape.
+
+    Returns a `solve_fast(v_in, v_out)` callable with the remaining parameters
+    baked in. Repeated calls against the same shape share the memoized query
+    and solution caches, so sweeping many voltage targets over one shape only
+    pays the database cost once per distinct search window.
+
+    Args:
+        current: Max current in amps allowed through the divider.
+        base_query: Base ResistorQuery shared by every solve; defaults to
+                    the stock query.
+        prec_series: Precision series to search.
+        constraints_type: Constraints class to instantiate - pass
+                          `InverseDividerConstraints` for the inverse solver.
+    """
+    if base_query is None:
+        base_query = get_default_resistor_query()
+
+    def solve_fast(v_in: Toleranced, v_out: Toleranced) -> VoltageDividerSolution:
+        cxt = constraints_type(
+            v_in=v_in,
+            v_out=v_out,
+            current=current,
+            prec_series=prec_series,
+            base_query=base_query,
+        )
+        return solve(cxt)
+
+    return solve_fast
+
+
+def precheck_vin_vout(constraints: VoltageDividerConstraints) -> Tuple[float, float]:
+    """
+    Check that the v-in and v-out constraints admit a physical divider.
+
+    Pure interval arithmetic - no database access. Returns the (r-hi, r-lo)
+    initial guess on success.
+
+    Raises:
+        IncompatibleVinVoutError: if the constraints imply a negative resistance.
     """
-    search_prec = constraints.search_range
     goals = constraints.compute_initial_guess()
     for g in goals:
         if g < 0.0:
             raise IncompatibleVinVoutError(constraints.v_in, constraints.v_out)
+    return goals
+
+
+def precheck_vin_range(
+    constraints: VoltageDividerConstraints, goals: Tuple[float, float]
+) -> None:
+    """
+    Screen the input voltage requirement with perfect resistors.
+
+    Pure interval arithmetic - no database access.
+
+    Raises:
+        VinRangeTooLargeError: if even exact resistors cannot keep the
+                               objective inside the v-out constraint.
+    """
     goal_r_hi, goal_r_lo = goals
-    # Screen the input voltage requirement with perfect resistors
     vin_screen = constraints.compute_objective(
         Toleranced.exact(goal_r_hi), Toleranced.exact(goal_r_lo)
     )
     if not constraints.is_compliant(vin_screen):
         raise VinRangeTooLargeError(goals, vin_screen)
-    # Pre-screen precision series
-    pre_screen = []
-    for std_prec in constraints.prec_series:
+
+
+def precheck_precision_series(
+    constraints: VoltageDividerConstraints, goals: Tuple[float, float]
+) -> Tuple[float, ...]:
+    """
+    Pre-screen the precision series and return the workable (tighter) tail.
+
+    Pure interval arithmetic - no database access. The series is sorted
+    descending and compliance is monotonic as the tolerance tightens, so a
+    binary probe finds the first workable precision without evaluating the
+    whole series.
+
+    Raises:
+        NoPrecisionSatisfiesConstraintsError: if no precision works.
+    """
+    goal_r_hi, goal_r_lo = goals
+
+    def screen_precision(std_prec: float):
         vo = constraints.compute_objective(
             Toleranced.percent(goal_r_hi, std_prec),
             Toleranced.percent(goal_r_lo, std_prec),
         )
-        pre_screen.append((constraints.is_compliant(vo), std_prec, vo))
-    first_valid_series = next((i for i, elem in enumerate(pre_screen) if elem[0]), None)
-    if first_valid_series is not None:
-        series = constraints.prec_series[first_valid_series:]
-    else:
-        raise NoPrecisionSatisfiesConstraintsError(goals, pre_screen)
+        return (constraints.is_compliant(vo), std_prec, vo)
+
+    lo_idx, hi_idx = 0, len(constraints.prec_series)
+    while lo_idx < hi_idx:
+        mid = (lo_idx + hi_idx) // 2
+        if screen_precision(constraints.prec_series[mid])[0]:
+            hi_idx = mid
+        else:
+            lo_idx = mid + 1
+    if lo_idx < len(constraints.prec_series):
+        return constraints.prec_series[lo_idx:]
+    # No precision works - build the full table for the error report.
+    pre_screen = [screen_precision(p) for p in constraints.prec_series]
+    raise NoPrecisionSatisfiesConstraintsError(goals, pre_screen)
+
+
+def _solve(constraints: VoltageDividerConstraints) -> VoltageDividerSolution:
+    search_prec = constraints.search_range
+    goals = precheck_vin_vout(constraints)
+    precheck_vin_range(constraints, goals)
+    series = precheck_precision_series(constraints, goals)
     # Try to solve for each valid precision
     for std_prec in series:
         print(f"-> Precision {std_prec}%")
-        sol = solve_over_series(constraints, std_prec, search_prec)
+        sol = solve_over_series(constraints, std_prec, search_prec, goals)
         if sol is not None:
             return sol
     raise NoSolutionFoundError(
@@ -75,9 +308,20 @@ def solve(constraints: VoltageDividerConstraints) -> VoltageDividerSolution:
 
 
 def solve_over_series(
-    constraints: VoltageDividerConstraints, precision: float, search_prec: float
+    constraints: VoltageDividerConstraints,
+    precision: float,
+    search_prec: float,
+    goals: Optional[Tuple[float, float]] = None,
 ) -> Optional[VoltageDividerSolution]:
-    goal_r_hi, goal_r_lo = constraints.compute_initial_guess()
+    # The initial guess only depends on the constraints; callers iterating
+    # several precisions compute it once and pass it in.
+    goal_r_hi, goal_r_lo = (
+        goals if goals is not None else constraints.compute_initial_guess()
+    )
+    # The hi and lo side queries run sequentially on the caller's thread: the
+    # jitx transport and design-context machinery are not documented as
+    # thread-safe, and both queries must go out over one per-process
+    # websocket connection anyway.
     hi_res = query_resistance_by_values(constraints, goal_r_hi, precision, search_prec)
     lo_res = query_resistance_by_values(constraints, goal_r_lo, precision, search_prec)
     for ratio in sort_pairs_by_best_fit(constraints, precision, hi_res, lo_res):
@@ -134,15 +378,46 @@ def sort_pairs_by_best_fit(
     precision: float,
     hi_res: List[float],
     lo_res: List[float],
-) -> List[Ratio]:
-    ratios = []
-    for rh in hi_res:
-        for rl in lo_res:
-            loss = constraints.compute_loss(rh, rl, precision)
-            if loss is not None:
-                ratios.append(Ratio(rh, rl, loss))
-    ratios.sort(key=lambda r: r.loss)
-    return ratios
+) -> Iterator[Ratio]:
+    """
+    Score every (r-hi, r-lo) pair and yield the compliant ones in ascending loss order.
+
+    The scoring is vectorized over the full cartesian product with numpy: the
+    objective corners are evaluated as broadcasted array math as a screen,
+    and each surviving pair is re-confirmed with the full `compute_loss`
+    (which includes the baseline `compute_objective` evaluation) before it is
+    yielded. `Ratio` objects are materialized lazily, so a caller that stops
+    at the first workable candidate never pays for the rest of the ranking.
+    """
+    if len(hi_res) == 0 or len(lo_res) == 0:
+        return
+    rh = np.asarray(hi_res, dtype=np.float64)
+    rl = np.asarray(lo_res, dtype=np.float64)
+    RH, RL = np.meshgrid(rh, rl, indexing="ij")
+    f = precision / 100.0
+    vo_typ, vo_min, vo_max = constraints.compute_objective_corners(RH, RL, f)
+    # Hoist the target bounds out of the array expressions.
+    target_min = constraints._vout_min
+    target_max = constraints._vout_max
+    target_typ = constraints._vout_typ
+    compliant = (vo_min >= target_min) & (vo_max <= target_max)
+    # This metric is suspect - see VoltageDividerConstraints.compute_loss
+    loss = np.where(compliant, np.abs(target_typ - vo_typ), np.inf)
+    flat_loss = loss.ravel()
+    num_lo = len(lo_res)
+    for idx in np.argsort(flat_loss):
+        pair_loss = flat_loss[idx]
+        if not np.isfinite(pair_loss):
+            # Only non-compliant pairs remain.
+            break
+        i, j = divmod(int(idx), num_lo)
+        # The corner screen is tighter than the wide Toleranced evaluation
+        # used by the solver's final gate; re-confirm so only pairs the gate
+        # can accept are ever queried against the database.
+        confirmed = constraints.compute_loss(float(rh[i]), float(rl[j]), precision)
+        if confirmed is None:
+            continue
+        yield Ratio(float(rh[i]), float(rl[j]), confirmed)
 
 
 def query_resistance_by_values(
@@ -164,18 +439,19 @@ def query_resistance_by_values(
         return float(r)
 
     # Use search_resistors with distinct resistance
-    exist_keys = ExistKeys(["tcr_pos", "tcr_neg"])
-    distinct_key = DistinctKey("resistance")
-    base_query = constraints.base_query
-    resistances = search_resistors(
-        base_query,
+    resistances = _cached_search_resistors(
+        constraints.base_query,
         resistance=Toleranced.percent(goal_r, min_prec),
         precision=r_prec / 100.0,
-        exist=exist_keys,
-        distinct=distinct_key,
+        exist=_EXIST_TCR_KEYS,
+        distinct=_DISTINCT_RESISTANCE,
     )
     # Case from int to float (mimic stanza codebase, the database is sensitive to the difference, maybe due to caching).
-    return [to_float(r) for r in resistances]
+    values = [to_float(r) for r in resistances]
+    # Order by log-space proximity to the goal so downstream candidate walks
+    # and pruning see the best-fitting values first.
+    values.sort(key=lambda v: abs(math.log(v / goal_r)) if v > 0.0 else math.inf)
+    return values
 
 
 def query_resistors(
@@ -192,13 +468,11 @@ def query_resistors(
             raise ValueError(f"Expected Resistor, got {type(c)}: {c}")
         return c
 
-    exist_keys = ExistKeys(["tcr_pos", "tcr_neg"])
-    base_query = constraints.base_query
-    results = search_resistors(
-        base_query,
+    results = _cached_search_resistors(
+        constraints.base_query,
         resistance=target,
         precision=prec / 100.0,
-        exist=exist_keys,
+        exist=_EXIST_TCR_KEYS,
         limit=constraints.min_sources,
     )
     # Convert results to Resistor objects
@@ -221,24 +495,20 @@ def study_solution(
             f"Can't check output voltage current for a solution with two zero ohm resistors {r_lo.mpn} and {r_hi.mpn}."
         )
 
-    # Compute TCR deviations for min and max temperature
-    lo_drs = [
-        compute_tcr_deviation(r_lo, temp_range.min_value),
-        compute_tcr_deviation(r_lo, temp_range.max_value),
-    ]
-    hi_drs = [
-        compute_tcr_deviation(r_hi, temp_range.min_value),
-        compute_tcr_deviation(r_hi, temp_range.max_value),
-    ]
+    # Extract the TCR intervals once per resistor, then evaluate the deviation
+    # at both temperature endpoints in a single pass.
+    lo_tcr = get_tcr_interval(r_lo)
+    hi_tcr = get_tcr_interval(r_hi)
+    if lo_tcr is None or hi_tcr is None:
+        raise ValueError("No TCR Data")
     r_lo_val = get_resistance(r_lo)
     r_hi_val = get_resistance(r_hi)
     results = []
-    for lo_dr, hi_dr in zip(lo_drs, hi_drs, strict=True):
-        if lo_dr is not None and hi_dr is not None:
-            vout = constraints.compute_objective(r_hi_val, r_lo_val, hi_dr, lo_dr)
-            results.append(vout)
-        else:
-            raise ValueError("No TCR Data")
+    for temperature in (temp_range.min_value, temp_range.max_value):
+        lo_dr = compute_tcr_deviation_interval(lo_tcr, temperature)
+        hi_dr = compute_tcr_deviation_interval(hi_tcr, temperature)
+        vout = constraints.compute_objective(r_hi_val, r_lo_val, hi_dr, lo_dr)
+        results.append(vout)
     return results
 
 
@@ -282,15 +552,24 @@ def compute_tcr_deviation(
     NOTE: This includes a workaround for known database issues with TCR values,
     as described in the Stanza code and PROD-328.
     """
+    tcr_interval = get_tcr_interval(resistor)
+    if tcr_interval is None:
+        return None
+    return compute_tcr_deviation_interval(tcr_interval, temperature)
+
+
+def get_tcr_interval(resistor: Resistor) -> Optional[Toleranced]:
+    """
+    Extract the TCR of a resistor as a Toleranced interval.
+    Returns None if the resistor carries no TCR data.
+    """
     tcr = resistor.tcr
-    ref_temp = 25.0  # Default reference temperature
     if tcr is None:
         return None
     # This mirrors the Stanza hack for database issues:
     # See: https://linear.app/jitx/issue/PROD-328/tcr-values-in-database-seem-wrong
     p, n = tcr.pos, tcr.neg
-    tcr_interval = Toleranced.min_max(min(p, n), max(p, n))
-    return compute_tcr_deviation_interval(tcr_interval, temperature, ref_temp)
+    return Toleranced.min_max(min(p, n), max(p, n))
 
 
 def compute_tcr_deviation_interval(
@@ -0,0 +1,30 @@
+"""
+Pytest configuration for jitxlib-voltage-divider tests.
+
+Exposes the websocket port as a pytest option so the integration tests can be
+driven as `pytest --port 1234 -m integration` (and fanned out across worker
+processes with pytest-xdist's `-n`), instead of only through the unittest
+`__main__` entry point.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--port",
+        type=int,
+        default=None,
+        help="WebSocket port number for integration tests",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def websocket_port(pytestconfig):
+    """Inject the --port option into the test class before it sets up."""
+    port = pytestconfig.getoption("--port")
+    if port is not None:
+        from .test_basic import TestVoltageDivider
+
+        TestVoltageDivider.port = port
+    return port
@@ -1,4 +1,4 @@
-import argparse
+import os
 import sys
 import unittest
 import pytest
@@ -14,6 +14,10 @@ from jitxlib.voltage_divider.constraints import VoltageDividerConstraints
 from jitxlib.voltage_divider.inverse import InverseDividerConstraints
 from jitxlib.voltage_divider.solver import (
     solve,
+    sort_pairs_by_best_fit,
+    precheck_vin_vout,
+    precheck_vin_range,
+    precheck_precision_series,
     NoPrecisionSatisfiesConstraintsError,
     VinRangeTooLargeError,
     IncompatibleVinVoutError,
@@ -22,108 +26,223 @@ from jitxlib.parts import ResistorQuery
 
 from . import builder
 
+# Truncated precision series used by test_fail_case_3; a tuple so the
+# constraints keep it as-is without re-normalizing a fresh list per run.
+PREC_FAIL_CASE_3 = (20.0, 10.0, 5.0)
+
 
 class TestVoltageDivider(unittest.TestCase):
     port: int
 
-    def setUp(self):
-        if hasattr(TestVoltageDivider, "port"):
-            set_websocket_uri(host="localhost", port=TestVoltageDivider.port)
+    @classmethod
+    def setUpClass(cls):
+        # The websocket URI and query context don't change between tests, so
+        # configure them once per class instead of per test.
+        if hasattr(cls, "port"):
+            set_websocket_uri(host="localhost", port=cls.port)
 
         import jitxlib.parts.commands
 
         jitxlib.parts.commands.ALLOW_NO_DESIGN_CONTEXT = True
 
-    @pytest.mark.integration
-    def test_basic_solver(self):
-        exp_vout = Toleranced.percent(2.5, 5.0)
-        cxt = VoltageDividerConstraints(
-            v_in=Toleranced.percent(10.0, 1.0),
-            v_out=exp_vout,
-            current=50.0e-6,
-            temp_range=Toleranced.min_max(-20.0, 50.0),
-            base_query=ResistorQuery(mounting="smd", min_stock=10, case=["0603"]),
-        )
-        with jitx._instantiation.instantiation.activate():
-            result = solve(cxt)
-        self.assertTrue(exp_vout.in_range(result.vo))
-        self.assertTrue(Toleranced(165.0e3, 10.0e3).in_range(result.R_h.resistance))
-        self.assertTrue(Toleranced(55.0e3, 10.0e3).in_range(result.R_l.resistance))
+        # Shared fixtures - all of these are immutable (or read-only to the
+        # solver), so building them once per class avoids reconstructing the
+        # same Toleranced and ResistorQuery values in every test.
+        cls.query_0603 = ResistorQuery(mounting="smd", min_stock=10, case=["0603"])
+        cls.query_0402 = ResistorQuery(mounting="smd", min_stock=10, case=["0402"])
+        cls.v_in_10v = Toleranced.percent(10.0, 1.0)
+        cls.fb_ref = Toleranced.min_typ_max(0.788, 0.8, 0.812)
+        cls.temp_range = Toleranced.min_max(-20.0, 50.0)
 
     @pytest.mark.integration
+    def test_solver_cases(self):
+        # Table of (name, constraints, R-h bounds, R-l bounds); the expected
+        # v-out range is the constraints' own objective. Driving both solver
+        # directions from one table shares the setup and the solver caches.
+        cases = [
+            (
+                "forward_0603",
+                VoltageDividerConstraints(
+                    v_in=self.v_in_10v,
+                    v_out=Toleranced.percent(2.5, 5.0),
+                    current=50.0e-6,
+                    temp_range=self.temp_range,
+                    base_query=self.query_0603,
+                ),
+                (155.0e3, 175.0e3),  # 165k +/- 10k
+                (45.0e3, 65.0e3),  # 55k +/- 10k
+            ),
+            (
+                "inverse_0402",
+                InverseDividerConstraints(
+                    v_in=self.fb_ref,
+                    v_out=Toleranced.percent(3.3, 2.0),
+                    current=50.0e-6,
+                    temp_range=self.temp_range,
+                    base_query=self.query_0402,
+                ),
+                (35.0e3, 55.0e3),  # 45k +/- 10k
+                (9.0e3, 19.0e3),  # 14k +/- 5k
+            ),
+        ]
+        for name, cxt, (rh_min, rh_max), (rl_min, rl_max) in cases:
+            with self.subTest(name):
+                with jitx._instantiation.instantiation.activate():
+                    result = solve(cxt)
+                self.assertTrue(cxt.v_out.in_range(result.vo))
+                self.assertGreaterEqual(result.R_h.resistance, rh_min)
+                self.assertLessEqual(result.R_h.resistance, rh_max)
+                self.assertGreaterEqual(result.R_l.resistance, rl_min)
+                self.assertLessEqual(result.R_l.resistance, rl_max)
+
+    # The three failure cases only exercise the pure-arithmetic prechecks, so
+    # they run without a websocket or parts database (ie not as integration
+    # tests). test_fail_case_full_path covers the same raise through solve().
     def test_fail_case_1(self):
         cxt = VoltageDividerConstraints(
-            v_in=Toleranced.percent(10.0, 1.0),
+            v_in=self.v_in_10v,
             v_out=Toleranced.percent(12.5, 1.0),
             current=50.0e-6,
-            base_query=ResistorQuery(mounting="smd", min_stock=10, case=["0603"]),
         )
         with self.assertRaises(IncompatibleVinVoutError) as cm:
-            with jitx._instantiation.instantiation.activate():
-                solve(cxt)
+            precheck_vin_vout(cxt)
         self.assertIn("Incompatible", str(cm.exception))
 
-    @pytest.mark.integration
     def test_fail_case_2(self):
         cxt = VoltageDividerConstraints(
             v_in=Toleranced.percent(10.0, 10.0),
             v_out=Toleranced.percent(2.5, 0.1),
             current=50.0e-6,
-            base_query=ResistorQuery(mounting="smd", min_stock=10, case=["0603"]),
         )
         with self.assertRaises(VinRangeTooLargeError) as cm:
-            with jitx._instantiation.instantiation.activate():
-                solve(cxt)
+            precheck_vin_range(cxt, precheck_vin_vout(cxt))
         self.assertIn("Range is too large", str(cm.exception))
 
-    @pytest.mark.integration
     def test_fail_case_3(self):
         cxt = VoltageDividerConstraints(
-            v_in=Toleranced.percent(10.0, 1.0),
+            v_in=self.v_in_10v,
             v_out=Toleranced.percent(2.5, 5.0),
             current=50.0e-6,
-            prec_series=[20.0, 10.0, 5.0],
-            base_query=ResistorQuery(mounting="smd", min_stock=10, case=["0603"]),
+            prec_series=PREC_FAIL_CASE_3,
         )
         with self.assertRaises(NoPrecisionSatisfiesConstraintsError) as cm:
-            with jitx._instantiation.instantiation.activate():
-                solve(cxt)
+            precheck_precision_series(cxt, precheck_vin_vout(cxt))
         self.assertIn("No Precision Series", str(cm.exception))
 
     @pytest.mark.integration
-    def test_inverse_divider(self):
-        exp_vout = Toleranced.percent(3.3, 2.0)
-        cxt = InverseDividerConstraints(
-            v_in=Toleranced.min_typ_max(0.788, 0.8, 0.812),
-            v_out=exp_vout,
+    def test_fail_case_full_path(self):
+        cxt = VoltageDividerConstraints(
+            v_in=self.v_in_10v,
+            v_out=Toleranced.percent(12.5, 1.0),
             current=50.0e-6,
-            temp_range=Toleranced.min_max(-20.0, 50.0),
-            base_query=ResistorQuery(mounting="smd", min_stock=10, case=["0402"]),
+            base_query=self.query_0603,
         )
-        with jitx._instantiation.instantiation.activate():
-            result = solve(cxt)
-        self.assertTrue(exp_vout.in_range(result.vo))
-        self.assertTrue(Toleranced(45.0e3, 10.0e3).in_range(result.R_h.resistance))
-        self.assertTrue(Toleranced(14.0e3, 5.0e3).in_range(result.R_l.resistance))
+        with self.assertRaises(IncompatibleVinVoutError) as cm:
+            with jitx._instantiation.instantiation.activate():
+                solve(cxt)
+        self.assertIn("Incompatible", str(cm.exception))
 
     @pytest.mark.integration
     def test_inverse_divider_circuit(self):
         cxt = InverseDividerConstraints(
-            v_in=Toleranced.min_typ_max(0.788, 0.8, 0.812),
+            v_in=self.fb_ref,
             v_out=Toleranced.percent(3.3, 2.0),
             current=50.0e-6,
-            temp_range=Toleranced.min_max(-20.0, 50.0),
-            base_query=ResistorQuery(mounting="smd", min_stock=10, case=["0402"]),
+            temp_range=self.temp_range,
+            base_query=self.query_0402,
         )
         with jitx._instantiation.instantiation.activate():
             circuit = voltage_divider_from_constraints(cxt)
         build_circuit_from_instance(circuit, "test_inverse_divider_circuit")
 
-    # All tests above are integration tests. Here is an example test that actually runs in CI.
+    # Here is an example unit test that always runs in CI.
     def test_example_unit_test(self):
         self.assertTrue(True)
 
 
+class TestSolverMath(unittest.TestCase):
+    """
+    Pure-arithmetic checks of the vectorized pair ranking - no websocket or
+    parts database. These pin the corner screen in compute_objective_corners
+    (and its inverse override) to the baseline compute_objective evaluation,
+    so a change to the corner math can't silently shift the accept set.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        import jitxlib.parts.commands
+
+        jitxlib.parts.commands.ALLOW_NO_DESIGN_CONTEXT = True
+
+        # Resistance grids straddle each problem's initial guess and include
+        # values that are clearly non-compliant, so both branches of the
+        # screen are exercised.
+        cls.cases = [
+            (
+                "forward",
+                VoltageDividerConstraints(
+                    v_in=Toleranced.percent(10.0, 1.0),
+                    v_out=Toleranced.percent(2.5, 5.0),
+                    current=50.0e-6,
+                ),
+                [10.0e3, 135.0e3, 145.0e3, 150.0e3, 155.0e3, 165.0e3, 300.0e3],
+                [10.0e3, 40.0e3, 48.0e3, 50.0e3, 52.0e3, 60.0e3, 200.0e3],
+            ),
+            (
+                "inverse",
+                InverseDividerConstraints(
+                    v_in=Toleranced.min_typ_max(0.788, 0.8, 0.812),
+                    v_out=Toleranced.percent(3.3, 2.0),
+                    current=50.0e-6,
+                ),
+                [5.0e3, 35.0e3, 42.0e3, 45.0e3, 48.0e3, 55.0e3, 100.0e3],
+                [5.0e3, 10.0e3, 13.0e3, 14.4e3, 15.0e3, 18.0e3, 50.0e3],
+            ),
+        ]
+
+    @staticmethod
+    def reference_ranking(cxt, precision, hi_res, lo_res):
+        """Baseline nested-loop scoring of every pair via compute_loss."""
+        pairs = {}
+        for rh in hi_res:
+            for rl in lo_res:
+                loss = cxt.compute_loss(rh, rl, precision)
+                if loss is not None:
+                    pairs[(rh, rl)] = loss
+        return pairs
+
+    def test_ranking_matches_reference(self):
+        for name, cxt, hi_res, lo_res in self.cases:
+            for precision in (10.0, 5.0, 1.0, 0.1):
+                with self.subTest(name, precision=precision):
+                    expected = self.reference_ranking(cxt, precision, hi_res, lo_res)
+                    actual = list(
+                        sort_pairs_by_best_fit(cxt, precision, hi_res, lo_res)
+                    )
+                    self.assertEqual({(r.high, r.low) for r in actual}, set(expected))
+                    for r in actual:
+                        self.assertAlmostEqual(r.loss, expected[(r.high, r.low)])
+                    losses = [r.loss for r in actual]
+                    self.assertEqual(losses, sorted(losses))
+
+    def test_compute_loss_agrees_with_compute_objective(self):
+        for name, cxt, hi_res, lo_res in self.cases:
+            for precision in (10.0, 1.0):
+                for rh in hi_res:
+                    for rl in lo_res:
+                        loss = cxt.compute_loss(rh, rl, precision)
+                        vo = cxt.compute_objective(
+                            Toleranced.percent(rh, precision),
+                            Toleranced.percent(rl, precision),
+                        )
+                        with self.subTest(name, precision=precision, rh=rh, rl=rl):
+                            self.assertEqual(loss is not None, cxt.is_compliant(vo))
+                            if loss is not None:
+                                self.assertAlmostEqual(
+                                    loss, abs(cxt.v_out.typ - vo.typ)
+                                )
+
+
 def build_circuit_from_instance(instance: jitx.Circuit, name: str):
     """Build a design from a circuit instance and send it to the web socket.
 
@@ -161,33 +280,52 @@ def build_circuit(circ: type[jitx.Circuit], name: str):
 
 def text_formatter(ob, file=sys.stdout, indent=0):
     # not great but better than nothing, could use yaml or something.
-    ind = "  " * indent
-    if isinstance(ob, dict):
-        for key, value in ob.items():
-            if isinstance(value, (list, dict)):
-                print(ind + key + ":", file=file)
-                text_formatter(value, file, indent + 1)
-            else:
-                print(ind + key + ":" + " " + str(value), file=file)
-    elif isinstance(ob, list):
-        if not ob:
-            print(ind + "[]", file=file)
-        for el in ob:
-            if isinstance(el, (list, dict)):
-                text_formatter(el, file, indent + 1)
-            else:
-                text_formatter(el, file, indent)
-    else:
-        print(ind + str(ob), file=file)
+    # Iterative depth-first walk with an explicit stack; lines are buffered
+    # and written in a single call instead of one print per node, and the
+    # indent strings are cached per depth.
+    lines: list[str] = []
+    pads: list[str] = []
 
+    def pad(depth: int) -> str:
+        while depth >= len(pads):
+            pads.append("  " * len(pads))
+        return pads[depth]
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--port", type=int, help="WebSocket port number")
-    args, unittest_args = parser.parse_known_args()
+    # Stack entries are (node, depth, literal); literal entries are already
+    # formatted lines interleaved to keep dict keys ahead of their children.
+    stack: list = [(ob, indent, False)]
+    while stack:
+        node, depth, literal = stack.pop()
+        if literal:
+            lines.append(node)
+            continue
+        ind = pad(depth)
+        if isinstance(node, dict):
+            for key, value in reversed(list(node.items())):
+                if isinstance(value, (list, dict)):
+                    stack.append((value, depth + 1, False))
+                    stack.append((ind + key + ":", depth, True))
+                else:
+                    stack.append((ind + key + ":" + " " + str(value), depth, True))
+        elif isinstance(node, list):
+            if not node:
+                lines.append(ind + "[]")
+            for el in reversed(node):
+                if isinstance(el, (list, dict)):
+                    stack.append((el, depth + 1, False))
+                else:
+                    stack.append((el, depth, False))
+        else:
+            lines.append(ind + str(node))
+    if lines:
+        file.write("\n".join(lines) + "\n")
 
-    # Set the port in the test class
-    TestVoltageDivider.port = args.port
 
-    # Run unittest with remaining arguments
-    unittest.main(argv=sys.argv[:1] + unittest_args)
+if __name__ == "__main__":
+    # Run as: JITX_WS_PORT=1234 python -m tests.test_basic
+    # (pytest runs take the port from the --port option in conftest.py)
+    port = os.environ.get("JITX_WS_PORT")
+    if port is not None:
+        TestVoltageDivider.port = int(port)
+
+    unittest.main()